@@ -17,30 +17,48 @@
 
 # to make argcomplete perky, limit imports to the minimum here and in
 # subcommand modules
+import os
 import sys
 import six
 import argparse
 import pkgutil
 from . import subcommands
 
+# cache of dot separated paths to imported functions or classes
+_FUNC_CACHE = {}
+
 def import_func(path):
     '''
     Imports and returns a function or class from a dot separated path.
+    Results are cached so repeated lookups in the same process skip the
+    import machinery.
     '''
+    try:
+        return _FUNC_CACHE[path]
+    except KeyError:
+        pass
+
     parts = path.split('.')
     module_path = parts[:-1]
     func_name = parts[-1]
 
     module = __import__('.'.join(module_path), fromlist=module_path[:-1])
     func = getattr(module, func_name)
+    _FUNC_CACHE[path] = func
     return func
 
-def add_subcommands(subparsers):
+def add_subcommands(subparsers, service=None):
     """
     Adds subparsers for each of the service modules in the subcommands package.
+
+    If service is provided and matches a service module, only that module's
+    subparser is added.
     """
-    for _, service, _ in pkgutil.iter_modules(subcommands.__path__):
-        func = import_func("quantrocket._cli.subcommands.{0}.add_subparser".format(service))
+    services = [name for _, name, _ in pkgutil.iter_modules(subcommands.__path__)]
+    if service in services:
+        services = [service]
+    for name in services:
+        func = import_func("quantrocket._cli.subcommands.{0}.add_subparser".format(name))
         func(subparsers)
 
 def handle_error(msg):
@@ -71,11 +89,22 @@ class ArgumentParser(argparse.ArgumentParser):
             handle_error(message)
         return super(ArgumentParser, self).error(message)
 
-def get_parser():
+def get_parser(args=None):
+    """
+    Returns the CLI parser. If args (default sys.argv[1:]) name a
+    service, only that service's subcommands are added to the parser;
+    otherwise (no args, top-level options such as -h, or shell completion)
+    all services are added.
+    """
+    if args is None:
+        args = sys.argv[1:]
+    service = None
+    if args and not args[0].startswith("-") and "_ARGCOMPLETE" not in os.environ:
+        service = args[0]
     parser = ArgumentParser(description="QuantRocket command line interface")
     subparsers = parser.add_subparsers(title="commands", dest="command", help="for specific help type: quantrocket <subcommand> -h")
     subparsers.required = True
-    add_subcommands(subparsers)
+    add_subcommands(subparsers, service=service)
     return parser
 
 def main():
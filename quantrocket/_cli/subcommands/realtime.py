@@ -12,14 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from quantrocket._cli.utils.parse import HelpFormatter
+from quantrocket._cli.utils.parse import HelpFormatter, LazySubParsersAction, TupleAction
 
-def add_subparser(subparsers):
-    _parser = subparsers.add_parser("realtime", description="QuantRocket real-time market data CLI", help="Collect and query real-time market data")
-    _subparsers = _parser.add_subparsers(title="subcommands", dest="subcommand")
-    _subparsers.required = True
-
-    examples = """
+_EPILOG_CREATE_IBKR_TICK_DB = """
 Create a new database for collecting real-time tick data from Interactive Brokers.
 
 The market data requirements you specify when you create a new database are
@@ -45,39 +40,9 @@ Create a database for collecting trades and quotes for a universe of futures:
 .. code-block:: bash
 
     quantrocket realtime create-ibkr-tick-db cme-fut-taq -u cme-fut --fields LastPrice Volume BidPrice AskPrice BidSize AskSize
-    """
-    parser = _subparsers.add_parser(
-        "create-ibkr-tick-db",
-        help="create a new database for collecting real-time tick data from Interactive Brokers",
-        epilog=examples,
-        formatter_class=HelpFormatter)
-    parser.add_argument(
-        "code",
-        metavar="CODE",
-        help="the code to assign to the database (lowercase alphanumerics and hyphens only)")
-    parser.add_argument(
-        "-u", "--universes",
-        metavar="UNIVERSE",
-        nargs="*",
-        help="include these universes")
-    parser.add_argument(
-        "-i", "--sids",
-        metavar="SID",
-        nargs="*",
-        help="include these sids")
-    parser.add_argument(
-        "-f", "--fields",
-        metavar="FIELD",
-        nargs="*",
-        help="collect these fields (pass '?' or any invalid fieldname to see "
-        "available fields, default fields are 'LastPrice' and 'Volume')")
-    parser.add_argument(
-        "-p", "--primary-exchange",
-        action="store_true",
-        help="limit to data from the primary exchange")
-    parser.set_defaults(func="quantrocket.realtime._cli_create_ibkr_tick_db")
+"""
 
-    examples = """
+_EPILOG_CREATE_POLYGON_TICK_DB = """
 Create a new database for collecting real-time tick data from Polygon.
 
 The market data requirements you specify when you create a new database are
@@ -97,35 +62,9 @@ Create a database for collecting real-time trade prices and sizes for US stocks:
 .. code-block:: bash
 
     quantrocket realtime create-polygon-tick-db usa-stk-trades -u usa-stk --fields LastPrice LastSize
-    """
-    parser = _subparsers.add_parser(
-        "create-polygon-tick-db",
-        help="create a new database for collecting real-time tick data from Polygon",
-        epilog=examples,
-        formatter_class=HelpFormatter)
-    parser.add_argument(
-        "code",
-        metavar="CODE",
-        help="the code to assign to the database (lowercase alphanumerics and hyphens only)")
-    parser.add_argument(
-        "-u", "--universes",
-        metavar="UNIVERSE",
-        nargs="*",
-        help="include these universes")
-    parser.add_argument(
-        "-i", "--sids",
-        metavar="SID",
-        nargs="*",
-        help="include these sids")
-    parser.add_argument(
-        "-f", "--fields",
-        metavar="FIELD",
-        nargs="*",
-        help="collect these fields (pass '?' or any invalid fieldname to see "
-        "available fields, default fields are 'LastPrice' and 'LastSize')")
-    parser.set_defaults(func="quantrocket.realtime._cli_create_polygon_tick_db")
+"""
 
-    examples = """
+_EPILOG_CREATE_ALPACA_TICK_DB = """
 Create a new database for collecting real-time tick data from Alpaca.
 
 The market data requirements you specify when you create a new database are
@@ -145,35 +84,9 @@ Create a database for collecting real-time trade prices and sizes for US stocks:
 .. code-block:: bash
 
     quantrocket realtime create-alpaca-tick-db usa-stk-trades -u usa-stk --fields LastPrice LastSize
-    """
-    parser = _subparsers.add_parser(
-        "create-alpaca-tick-db",
-        help="create a new database for collecting real-time tick data from Alpaca",
-        epilog=examples,
-        formatter_class=HelpFormatter)
-    parser.add_argument(
-        "code",
-        metavar="CODE",
-        help="the code to assign to the database (lowercase alphanumerics and hyphens only)")
-    parser.add_argument(
-        "-u", "--universes",
-        metavar="UNIVERSE",
-        nargs="*",
-        help="include these universes")
-    parser.add_argument(
-        "-i", "--sids",
-        metavar="SID",
-        nargs="*",
-        help="include these sids")
-    parser.add_argument(
-        "-f", "--fields",
-        metavar="FIELD",
-        nargs="*",
-        help="collect these fields (pass '?' or any invalid fieldname to see "
-        "available fields, default fields are 'LastPrice' and 'LastSize')")
-    parser.set_defaults(func="quantrocket.realtime._cli_create_alpaca_tick_db")
+"""
 
-    examples = """
+_EPILOG_CREATE_AGG_DB = """
 Create an aggregate database from a tick database.
 
 Aggregate databases provide rolled-up views of the underlying tick data,
@@ -203,40 +116,9 @@ quotes, resulting in fields called BidPriceClose, AskPriceClose, BidSizeMean, an
 .. code-block:: bash
 
     quantrocket realtime create-agg-db cme-fut-taq-1sec --tick-db cme-fut-taq -z 1s -f BidPrice:Close AskPrice:Close BidSize:Mean AskSize:Mean
-    """
-    parser = _subparsers.add_parser(
-        "create-agg-db",
-        help="create an aggregate database from a tick database",
-        epilog=examples,
-        formatter_class=HelpFormatter)
-    parser.add_argument(
-        "code",
-        metavar="CODE",
-        help="the code to assign to the aggregate database (lowercase alphanumerics and hyphens only)")
-    parser.add_argument(
-        "-t", "--tick-db",
-        metavar="CODE",
-        required=True,
-        dest="tick_db_code",
-        help="the code of the tick database to aggregate")
-    parser.add_argument(
-        "-z", "--bar-size",
-        metavar="BAR_SIZE",
-        required=True,
-        help="the time frequency to aggregate to (use a Pandas timedelta string, for example "
-        "10s or 1m or 2h or 1d)")
-    parser.add_argument(
-        "-f", "--fields",
-        metavar="FIELD",
-        nargs="*",
-        help="include these fields in aggregate database, aggregated in these ways. Specify as a "
-        "list of strings mapping tick db fields to a comma-separated list of aggregate functions "
-        "to apply to the field. Format strings as 'FIELD:FUNC1,FUNC2'. Available aggregate functions "
-        "are 'Close', 'Open', 'High', 'Low', 'Mean', 'Sum', and 'Count'. See examples. If not "
-        "specified, defaults to including the 'Close' for each tick db field.")
-    parser.set_defaults(func="quantrocket.realtime._cli_create_agg_db")
+"""
 
-    examples = """
+_EPILOG_CONFIG = """
 Return the configuration for a tick database or aggregate database.
 
 Notes
@@ -259,18 +141,9 @@ Return the configuration for an aggregate database called "cme-fut-taq-1s":
 .. code-block:: bash
 
     quantrocket realtime config cme-fut-taq-1s
-    """
-    parser = _subparsers.add_parser(
-        "config",
-        help="return the configuration for a tick database or aggregate database",
-        epilog=examples,
-        formatter_class=HelpFormatter)
-    parser.add_argument(
-        "code",
-        help="the tick database code or aggregate database code")
-    parser.set_defaults(func="quantrocket.realtime._cli_get_db_config")
+"""
 
-    examples = """
+_EPILOG_DROP_DB = """
 Delete a tick database or aggregate database.
 
 Deleting a tick database deletes its configuration and data and any
@@ -293,29 +166,9 @@ Delete a database called "usa-stk-trades":
 .. code-block:: bash
 
     quantrocket realtime drop-db usa-stk-trades --confirm-by-typing-db-code-again usa-stk-trades
-    """
-    parser = _subparsers.add_parser(
-        "drop-db",
-        help="delete a tick database or aggregate database",
-        epilog=examples,
-        formatter_class=HelpFormatter)
-    parser.add_argument(
-        "code",
-        help="the tick database code or aggregate database code")
-    parser.add_argument(
-        "--confirm-by-typing-db-code-again",
-        metavar="CODE",
-        required=True,
-        help="enter the db code again to confirm you want to drop the database, its config, "
-        "and all its data")
-    parser.add_argument(
-        "--cascade",
-        action="store_true",
-        help="also delete associated aggregated databases, if any. Only applicable when "
-       "deleting a tick database.")
-    parser.set_defaults(func="quantrocket.realtime._cli_drop_db")
+"""
 
-    examples = """
+_EPILOG_DROP_TICKS = """
 Delete ticks from a tick database. Does not delete any aggregate
 database records.
 
@@ -344,24 +197,9 @@ aggregate records are deleted):
 .. code-block:: bash
 
     quantrocket realtime drop-ticks usa-tech-stk-tick --older-than 7d
-    """
-    parser = _subparsers.add_parser(
-        "drop-ticks",
-        help="delete ticks from a tick database",
-        epilog=examples,
-        formatter_class=HelpFormatter)
-    parser.add_argument(
-        "code",
-        help="the tick database code")
-    parser.add_argument(
-        "-o", "--older-than",
-        metavar="TIMEDELTA",
-        required=True,
-        help="delete ticks older than this (use a Pandas timedelta string, for example "
-        "7d)")
-    parser.set_defaults(func="quantrocket.realtime._cli_drop_ticks")
+"""
 
-    examples = """
+_EPILOG_LIST = """
 List tick databases and associated aggregate databases.
 
 Notes
@@ -376,15 +214,9 @@ Examples
 .. code-block:: bash
 
     quantrocket realtime list
-    """
-    parser = _subparsers.add_parser(
-        "list",
-        help="list tick databases and associated aggregate databases",
-        epilog=examples,
-        formatter_class=HelpFormatter)
-    parser.set_defaults(func="quantrocket.realtime._cli_list_databases")
+"""
 
-    examples = """
+_EPILOG_COLLECT = """
 Collect real-time market data and save it to a tick database.
 
 A single snapshot of market data or a continuous stream of market data can
@@ -421,32 +253,368 @@ Collect a market data snapshot and wait until it completes:
 .. code-block:: bash
 
     quantrocket realtime collect usa-stk-trades --snapshot --wait
-    """
-    parser = _subparsers.add_parser(
+"""
+
+_EPILOG_ACTIVE = """
+Return the number of tickers currently being collected, by vendor and database.
+
+Notes
+-----
+Usage Guide:
+
+* Real-time Data: https://qrok.it/dl/qr/realtime
+
+Examples
+--------
+
+.. code-block:: bash
+
+    quantrocket realtime active
+"""
+
+_EPILOG_CANCEL = """
+Cancel market data collection.
+
+Notes
+-----
+Usage Guide:
+
+* Real-time Data: https://qrok.it/dl/qr/realtime
+
+Examples
+--------
+
+Cancel market data collection for a tick database called 'cme-fut-taq':
+
+.. code-block:: bash
+
+    quantrocket realtime cancel cme-fut-taq
+
+Cancel all market data collection:
+
+.. code-block:: bash
+
+    quantrocket realtime cancel --all
+"""
+
+_EPILOG_GET = """
+Query market data from a tick database or aggregate database and download to file.
+
+Notes
+-----
+Usage Guide:
+
+* Real-time Market Data File: https://qrok.it/dl/qr/realtime
+* get_prices: https://qrok.it/dl/qr/prices
+
+Examples
+--------
+
+Download a CSV of futures market data since 08:00 AM Chicago time:
+
+.. code-block:: bash
+
+    quantrocket realtime get cme-fut-taq --start-date '08:00:00 America/Chicago' -o cme_taq.csv
+"""
+
+_EPILOG_STREAM = """
+Stream incoming market data.
+
+This command does not cause data to be collected but connects to the stream of
+data already being collected.
+
+Notes
+-----
+Usage Guide:
+
+* WebSockets Streaming: https://qrok.it/dl/qr/realtime-stream
+
+Examples
+--------
+
+Stream all incoming market data:
+
+.. code-block:: bash
+
+    quantrocket realtime stream
+
+Stream a subset of fields and sids:
+
+.. code-block:: bash
+
+    quantrocket realtime stream --sids FIBBG265598 --fields BidPrice AskPrice
+"""
+
+def add_subparser(subparsers):
+    _parser = subparsers.add_parser("realtime", description="QuantRocket real-time market data CLI", help="Collect and query real-time market data")
+    _subparsers = _parser.add_subparsers(title="subcommands", dest="subcommand", action=LazySubParsersAction)
+    _subparsers.required = True
+
+    _subparsers.add_lazy_parser(
+        "create-ibkr-tick-db",
+        _build_create_ibkr_tick_db,
+        help="create a new database for collecting real-time tick data from Interactive Brokers",
+        epilog=_EPILOG_CREATE_IBKR_TICK_DB,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "create-polygon-tick-db",
+        _build_create_polygon_tick_db,
+        help="create a new database for collecting real-time tick data from Polygon",
+        epilog=_EPILOG_CREATE_POLYGON_TICK_DB,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "create-alpaca-tick-db",
+        _build_create_alpaca_tick_db,
+        help="create a new database for collecting real-time tick data from Alpaca",
+        epilog=_EPILOG_CREATE_ALPACA_TICK_DB,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "create-agg-db",
+        _build_create_agg_db,
+        help="create an aggregate database from a tick database",
+        epilog=_EPILOG_CREATE_AGG_DB,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "config",
+        _build_config,
+        help="return the configuration for a tick database or aggregate database",
+        epilog=_EPILOG_CONFIG,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "drop-db",
+        _build_drop_db,
+        help="delete a tick database or aggregate database",
+        epilog=_EPILOG_DROP_DB,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "drop-ticks",
+        _build_drop_ticks,
+        help="delete ticks from a tick database",
+        epilog=_EPILOG_DROP_TICKS,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "list",
+        _build_list,
+        help="list tick databases and associated aggregate databases",
+        epilog=_EPILOG_LIST,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
         "collect",
+        _build_collect,
         help="collect real-time market data and save it to a tick database",
-        epilog=examples,
+        epilog=_EPILOG_COLLECT,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "active",
+        _build_active,
+        help="return the number of tickers currently being collected, by vendor and database",
+        epilog=_EPILOG_ACTIVE,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "cancel",
+        _build_cancel,
+        help="cancel market data collection",
+        epilog=_EPILOG_CANCEL,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "get",
+        _build_get,
+        help="query market data from a tick database or aggregate database and download to file",
+        epilog=_EPILOG_GET,
+        formatter_class=HelpFormatter)
+
+    _subparsers.add_lazy_parser(
+        "stream",
+        _build_stream,
+        help="stream incoming market data",
+        epilog=_EPILOG_STREAM,
         formatter_class=HelpFormatter)
+
+def _build_create_ibkr_tick_db(parser):
+    parser.add_argument(
+        "code",
+        metavar="CODE",
+        help="the code to assign to the database (lowercase alphanumerics and hyphens only)")
+    parser.add_argument(
+        "-u", "--universes",
+        metavar="UNIVERSE",
+        nargs="*",
+        action=TupleAction,
+        help="include these universes")
+    parser.add_argument(
+        "-i", "--sids",
+        metavar="SID",
+        nargs="*",
+        action=TupleAction,
+        help="include these sids")
+    parser.add_argument(
+        "-f", "--fields",
+        metavar="FIELD",
+        nargs="*",
+        action=TupleAction,
+        help="collect these fields (pass '?' or any invalid fieldname to see "
+        "available fields, default fields are 'LastPrice' and 'Volume')")
+    parser.add_argument(
+        "-p", "--primary-exchange",
+        action="store_true",
+        help="limit to data from the primary exchange")
+    parser.set_defaults(func="quantrocket.realtime._cli_create_ibkr_tick_db")
+
+def _build_create_polygon_tick_db(parser):
+    parser.add_argument(
+        "code",
+        metavar="CODE",
+        help="the code to assign to the database (lowercase alphanumerics and hyphens only)")
+    parser.add_argument(
+        "-u", "--universes",
+        metavar="UNIVERSE",
+        nargs="*",
+        action=TupleAction,
+        help="include these universes")
+    parser.add_argument(
+        "-i", "--sids",
+        metavar="SID",
+        nargs="*",
+        action=TupleAction,
+        help="include these sids")
+    parser.add_argument(
+        "-f", "--fields",
+        metavar="FIELD",
+        nargs="*",
+        action=TupleAction,
+        help="collect these fields (pass '?' or any invalid fieldname to see "
+        "available fields, default fields are 'LastPrice' and 'LastSize')")
+    parser.set_defaults(func="quantrocket.realtime._cli_create_polygon_tick_db")
+
+def _build_create_alpaca_tick_db(parser):
+    parser.add_argument(
+        "code",
+        metavar="CODE",
+        help="the code to assign to the database (lowercase alphanumerics and hyphens only)")
+    parser.add_argument(
+        "-u", "--universes",
+        metavar="UNIVERSE",
+        nargs="*",
+        action=TupleAction,
+        help="include these universes")
+    parser.add_argument(
+        "-i", "--sids",
+        metavar="SID",
+        nargs="*",
+        action=TupleAction,
+        help="include these sids")
+    parser.add_argument(
+        "-f", "--fields",
+        metavar="FIELD",
+        nargs="*",
+        action=TupleAction,
+        help="collect these fields (pass '?' or any invalid fieldname to see "
+        "available fields, default fields are 'LastPrice' and 'LastSize')")
+    parser.set_defaults(func="quantrocket.realtime._cli_create_alpaca_tick_db")
+
+def _build_create_agg_db(parser):
+    parser.add_argument(
+        "code",
+        metavar="CODE",
+        help="the code to assign to the aggregate database (lowercase alphanumerics and hyphens only)")
+    parser.add_argument(
+        "-t", "--tick-db",
+        metavar="CODE",
+        required=True,
+        dest="tick_db_code",
+        help="the code of the tick database to aggregate")
+    parser.add_argument(
+        "-z", "--bar-size",
+        metavar="BAR_SIZE",
+        required=True,
+        help="the time frequency to aggregate to (use a Pandas timedelta string, for example "
+        "10s or 1m or 2h or 1d)")
+    parser.add_argument(
+        "-f", "--fields",
+        metavar="FIELD",
+        nargs="*",
+        action=TupleAction,
+        help="include these fields in aggregate database, aggregated in these ways. Specify as a "
+        "list of strings mapping tick db fields to a comma-separated list of aggregate functions "
+        "to apply to the field. Format strings as 'FIELD:FUNC1,FUNC2'. Available aggregate functions "
+        "are 'Close', 'Open', 'High', 'Low', 'Mean', 'Sum', and 'Count'. See examples. If not "
+        "specified, defaults to including the 'Close' for each tick db field.")
+    parser.set_defaults(func="quantrocket.realtime._cli_create_agg_db")
+
+def _build_config(parser):
+    parser.add_argument(
+        "code",
+        help="the tick database code or aggregate database code")
+    parser.set_defaults(func="quantrocket.realtime._cli_get_db_config")
+
+def _build_drop_db(parser):
+    parser.add_argument(
+        "code",
+        help="the tick database code or aggregate database code")
+    parser.add_argument(
+        "--confirm-by-typing-db-code-again",
+        metavar="CODE",
+        required=True,
+        help="enter the db code again to confirm you want to drop the database, its config, "
+        "and all its data")
+    parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="also delete associated aggregated databases, if any. Only applicable when "
+       "deleting a tick database.")
+    parser.set_defaults(func="quantrocket.realtime._cli_drop_db")
+
+def _build_drop_ticks(parser):
+    parser.add_argument(
+        "code",
+        help="the tick database code")
+    parser.add_argument(
+        "-o", "--older-than",
+        metavar="TIMEDELTA",
+        required=True,
+        help="delete ticks older than this (use a Pandas timedelta string, for example "
+        "7d)")
+    parser.set_defaults(func="quantrocket.realtime._cli_drop_ticks")
+
+def _build_list(parser):
+    parser.set_defaults(func="quantrocket.realtime._cli_list_databases")
+
+def _build_collect(parser):
     parser.add_argument(
         "codes",
         metavar="CODE",
         nargs="+",
+        action=TupleAction,
         help="the tick database code(s) to collect data for")
     parser.add_argument(
         "-i", "--sids",
         nargs="*",
+        action=TupleAction,
         metavar="SID",
         help="collect market data for these sids, overriding db config "
         "(typically used to collect a subset of securities)")
     parser.add_argument(
         "-u", "--universes",
         nargs="*",
+        action=TupleAction,
         metavar="UNIVERSE",
         help="collect market data for these universes, overriding db config "
         "(typically used to collect a subset of securities)")
     parser.add_argument(
         "-f", "--fields",
         nargs="*",
+        action=TupleAction,
         metavar="FIELD",
         help="limit to these fields, overriding db config")
     parser.add_argument(
@@ -468,75 +636,30 @@ Collect a market data snapshot and wait until it completes:
         "to return immediately). Requires --snapshot")
     parser.set_defaults(func="quantrocket.realtime._cli_collect_market_data")
 
-    examples = """
-Return the number of tickers currently being collected, by vendor and database.
-
-Notes
------
-Usage Guide:
-
-* Real-time Data: https://qrok.it/dl/qr/realtime
-
-Examples
---------
-
-.. code-block:: bash
-
-    quantrocket realtime active
-    """
-    parser = _subparsers.add_parser(
-        "active",
-        help="return the number of tickers currently being collected, by vendor and database",
-        epilog=examples,
-        formatter_class=HelpFormatter)
+def _build_active(parser):
     parser.add_argument(
         "-d", "--detail",
         action="store_true",
         help="return lists of tickers (default is to return counts of tickers)")
     parser.set_defaults(func="quantrocket.realtime._cli_get_active_collections")
 
-    examples = """
-Cancel market data collection.
-
-Notes
------
-Usage Guide:
-
-* Real-time Data: https://qrok.it/dl/qr/realtime
-
-Examples
---------
-
-Cancel market data collection for a tick database called 'cme-fut-taq':
-
-.. code-block:: bash
-
-    quantrocket realtime cancel cme-fut-taq
-
-Cancel all market data collection:
-
-.. code-block:: bash
-
-    quantrocket realtime cancel --all
-    """
-    parser = _subparsers.add_parser(
-        "cancel",
-        help="cancel market data collection",
-        epilog=examples,
-        formatter_class=HelpFormatter)
+def _build_cancel(parser):
     parser.add_argument(
         "codes",
         metavar="CODE",
         nargs="*",
+        action=TupleAction,
         help="the tick database code(s) to cancel collection for")
     parser.add_argument(
         "-i", "--sids",
         nargs="*",
+        action=TupleAction,
         metavar="SID",
         help="cancel market data for these sids, overriding db config")
     parser.add_argument(
         "-u", "--universes",
         nargs="*",
+        action=TupleAction,
         metavar="UNIVERSE",
         help="cancel market data for these universes, overriding db config")
     parser.add_argument(
@@ -546,30 +669,7 @@ Cancel all market data collection:
         help="cancel all market data collection")
     parser.set_defaults(func="quantrocket.realtime._cli_cancel_market_data")
 
-    examples = """
-Query market data from a tick database or aggregate database and download to file.
-
-Notes
------
-Usage Guide:
-
-* Real-time Market Data File: https://qrok.it/dl/qr/realtime
-* get_prices: https://qrok.it/dl/qr/prices
-
-Examples
---------
-
-Download a CSV of futures market data since 08:00 AM Chicago time:
-
-.. code-block:: bash
-
-    quantrocket realtime get cme-fut-taq --start-date '08:00:00 America/Chicago' -o cme_taq.csv
-    """
-    parser = _subparsers.add_parser(
-        "get",
-        help="query market data from a tick database or aggregate database and download to file",
-        epilog=examples,
-        formatter_class=HelpFormatter)
+def _build_get(parser):
     parser.add_argument(
         "code",
         metavar="CODE",
@@ -592,21 +692,25 @@ Download a CSV of futures market data since 08:00 AM Chicago time:
     filters.add_argument(
         "-u", "--universes",
         nargs="*",
+        action=TupleAction,
         metavar="UNIVERSE",
         help="limit to these universes")
     filters.add_argument(
         "-i", "--sids",
         nargs="*",
+        action=TupleAction,
         metavar="SID",
         help="limit to these sids")
     filters.add_argument(
         "--exclude-universes",
         nargs="*",
+        action=TupleAction,
         metavar="UNIVERSE",
         help="exclude these universes")
     filters.add_argument(
         "--exclude-sids",
         nargs="*",
+        action=TupleAction,
         metavar="SID",
         help="exclude these sids")
     outputs = parser.add_argument_group("output options")
@@ -626,55 +730,28 @@ Download a CSV of futures market data since 08:00 AM Chicago time:
         "-f", "--fields",
         metavar="FIELD",
         nargs="*",
+        action=TupleAction,
         help="only return these fields (pass '?' or any invalid fieldname to see "
         "available fields)")
     parser.set_defaults(func="quantrocket.realtime._cli_download_market_data_file")
 
-    examples = """
-Stream incoming market data.
-
-This command does not cause data to be collected but connects to the stream of
-data already being collected.
-
-Notes
------
-Usage Guide:
-
-* WebSockets Streaming: https://qrok.it/dl/qr/realtime-stream
-
-Examples
---------
-
-Stream all incoming market data:
-
-.. code-block:: bash
-
-    quantrocket realtime stream
-
-Stream a subset of fields and sids:
-
-.. code-block:: bash
-
-    quantrocket realtime stream --sids FIBBG265598 --fields BidPrice AskPrice
-    """
-    parser = _subparsers.add_parser(
-        "stream",
-        help="stream incoming market data",
-        epilog=examples,
-        formatter_class=HelpFormatter)
+def _build_stream(parser):
     parser.add_argument(
         "-i", "--sids",
         nargs="*",
+        action=TupleAction,
         metavar="SID",
         help="limit to these sids")
     parser.add_argument(
         "--exclude-sids",
         nargs="*",
+        action=TupleAction,
         metavar="SID",
         help="exclude these sids")
     parser.add_argument(
         "-f", "--fields",
         nargs="*",
+        action=TupleAction,
         metavar="FIELD",
         help="limit to these fields")
     parser.set_defaults(func="quantrocket.realtime._cli_stream_market_data")
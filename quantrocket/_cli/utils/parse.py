@@ -71,4 +71,53 @@ def dict_to_dict_strs(d):
     """
     Parses a dict to a list of key:value strings. Used to go from Python->HTTP.
     """
-    return ["{0}:{1}".format(k,v) for k,v in d.items()]
\ No newline at end of file
+    return ["{0}:{1}".format(k,v) for k,v in d.items()]
+
+
+class _LazyParserMap(dict):
+    """
+    Dict of subcommand name to parser which runs the subcommand's builder
+    the first time its parser is looked up.
+    """
+    def __init__(self):
+        super().__init__()
+        self.builders = {}
+
+    def __getitem__(self, name):
+        parser = super().__getitem__(name)
+        builder = self.builders.pop(name, None)
+        if builder is not None:
+            builder(parser)
+        return parser
+
+class LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers action that defers adding arguments to a subcommand's parser
+    until the subcommand is actually invoked.
+
+    Register subcommands with `add_lazy_parser`, passing a builder function
+    that receives the subcommand's (initially empty) parser and adds the
+    arguments to it. The empty parser is enough for the subcommand to be
+    listed in the parent parser's help.
+
+    Usage:
+
+    >>> _subparsers = _parser.add_subparsers(action=LazySubParsersAction)
+    >>> _subparsers.add_lazy_parser("list", _build_list, help="list things")
+    """
+    def __init__(self, *args, **kwargs):
+        super(LazySubParsersAction, self).__init__(*args, **kwargs)
+        self._name_parser_map = self.choices = _LazyParserMap()
+
+    def add_lazy_parser(self, name, builder, **kwargs):
+        parser = self.add_parser(name, **kwargs)
+        self._name_parser_map.builders[name] = builder
+        return parser
+
+class TupleAction(argparse.Action):
+    """
+    Action for nargs="*" or nargs="+" arguments that stores the values as a
+    tuple rather than a list, so that parsed arguments are hashable.
+    """
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, tuple(values))
@@ -0,0 +1,151 @@
+# Copyright 2017-2024 QuantRocket LLC - All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# To run: pytest path/to/quantrocket/tests -v
+
+import io
+import os
+import pkgutil
+import unittest
+import argparse
+import contextlib
+from unittest.mock import patch
+from quantrocket._cli.commands import get_parser
+from quantrocket._cli.utils.parse import TupleAction
+from quantrocket._cli import subcommands
+from quantrocket._cli.subcommands import realtime
+
+REALTIME_SUBCOMMANDS = [
+    "create-ibkr-tick-db",
+    "create-polygon-tick-db",
+    "create-alpaca-tick-db",
+    "create-agg-db",
+    "config",
+    "drop-db",
+    "drop-ticks",
+    "list",
+    "collect",
+    "active",
+    "cancel",
+    "get",
+    "stream",
+]
+
+def get_help(args):
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        try:
+            get_parser(args).parse_args(args)
+        except SystemExit:
+            pass
+    return stdout.getvalue()
+
+def get_commands(parser):
+    return list(parser._subparsers._group_actions[0].choices)
+
+class GetParserTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.all_services = sorted(
+            name for _, name, _ in pkgutil.iter_modules(subcommands.__path__))
+
+    @patch.dict(os.environ)
+    def test_load_only_invoked_service(self):
+        os.environ.pop("_ARGCOMPLETE", None)
+        parser = get_parser(["realtime", "collect", "a"])
+        self.assertListEqual(get_commands(parser), ["realtime"])
+
+    @patch.dict(os.environ)
+    def test_load_all_services_for_help_or_no_args(self):
+        os.environ.pop("_ARGCOMPLETE", None)
+        for args in (["-h"], []):
+            parser = get_parser(args)
+            self.assertListEqual(sorted(get_commands(parser)), self.all_services)
+
+    @patch.dict(os.environ)
+    def test_load_all_services_for_unknown_service(self):
+        os.environ.pop("_ARGCOMPLETE", None)
+        parser = get_parser(["nosuchservice", "list"])
+        self.assertListEqual(sorted(get_commands(parser)), self.all_services)
+
+    @patch.dict(os.environ, {"_ARGCOMPLETE": "1"})
+    def test_load_all_services_for_completion(self):
+        parser = get_parser(["realtime"])
+        self.assertListEqual(sorted(get_commands(parser)), self.all_services)
+
+class LazySubParsersActionTestCase(unittest.TestCase):
+
+    def test_only_invoked_subcommand_is_built(self):
+        builder_names = [
+            "_build_" + subcommand.replace("-", "_") for subcommand in REALTIME_SUBCOMMANDS]
+        builders = {}
+        with contextlib.ExitStack() as stack:
+            for name in builder_names:
+                builders[name] = stack.enter_context(patch.object(
+                    realtime, name, wraps=getattr(realtime, name)))
+
+            args = ["realtime", "collect", "a", "-i", "x"]
+            get_parser(args).parse_args(args)
+
+        for name, builder in builders.items():
+            if name == "_build_collect":
+                self.assertEqual(builder.call_count, 1)
+            else:
+                builder.assert_not_called()
+
+    def test_help_lists_all_subcommands(self):
+        help_text = get_help(["realtime", "-h"])
+        for subcommand in REALTIME_SUBCOMMANDS:
+            self.assertIn(subcommand, help_text)
+
+    def test_parse_subcommand(self):
+        args = ["realtime", "collect", "a", "-i", "x"]
+        parsed = get_parser(args).parse_args(args)
+        self.assertDictEqual(
+            vars(parsed),
+            {
+                "command": "realtime",
+                "subcommand": "collect",
+                "codes": ("a",),
+                "sids": ("x",),
+                "universes": None,
+                "fields": None,
+                "until": None,
+                "snapshot": False,
+                "wait": False,
+                "func": "quantrocket.realtime._cli_collect_market_data",
+            })
+
+    def test_subcommand_help_includes_arguments_and_epilog(self):
+        help_text = get_help(["realtime", "collect", "-h"])
+        self.assertIn("--snapshot", help_text)
+        self.assertIn("quantrocket realtime collect japan-banks-trades", help_text)
+
+class TupleActionTestCase(unittest.TestCase):
+
+    def test_store_tuples(self):
+        parser = argparse.ArgumentParser()
+        parser.add_argument("codes", nargs="+", action=TupleAction)
+        parser.add_argument("-i", "--sids", nargs="*", action=TupleAction)
+        parser.add_argument("-u", "--universes", nargs="*", action=TupleAction)
+
+        args = parser.parse_args(["a", "b", "-u", "x", "y"])
+        self.assertEqual(args.codes, ("a", "b"))
+        self.assertEqual(args.universes, ("x", "y"))
+        self.assertIsNone(args.sids)
+
+        args = parser.parse_args(["a", "-i"])
+        self.assertEqual(args.codes, ("a",))
+        self.assertEqual(args.sids, ())
+        self.assertIsNone(args.universes)
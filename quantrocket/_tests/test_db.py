@@ -0,0 +1,397 @@
+# Copyright 2017-2024 QuantRocket LLC - All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# To run: pytest path/to/quantrocket/tests -v
+
+import os
+import json
+import time
+import threading
+import unittest
+import requests
+from unittest.mock import patch, MagicMock
+from concurrent.futures import Future
+from quantrocket import db, history, realtime
+from quantrocket.db import (
+    list_databases,
+    get_s3_config,
+    s3_push_databases,
+    s3_pull_databases,
+    optimize_databases,
+)
+
+def mock_response(json_response):
+    response = MagicMock()
+    response.json.return_value = json_response
+    response.content = json.dumps(json_response).encode()
+    return response
+
+class ListDatabasesCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        db._LIST_DB_CACHE.clear()
+        self.addCleanup(db._LIST_DB_CACHE.clear)
+
+    @patch("quantrocket.db.houston")
+    def test_repeat_calls_use_cache(self, mock_houston):
+        mock_houston.get.return_value = mock_response({"sqlite": ["a"], "postgres": []})
+
+        databases = list_databases(services="history", detail=True)
+        self.assertDictEqual(databases, {"sqlite": ["a"], "postgres": []})
+
+        # mutating the result should not affect the cache
+        databases["sqlite"].append("b")
+
+        databases = list_databases(services=["history"], detail=True)
+        self.assertDictEqual(databases, {"sqlite": ["a"], "postgres": []})
+        self.assertEqual(mock_houston.get.call_count, 1)
+
+        # different params aren't served from the cache
+        list_databases(services="history")
+        self.assertEqual(mock_houston.get.call_count, 2)
+
+    @patch("quantrocket.db.houston")
+    def test_cache_expires(self, mock_houston):
+        mock_houston.get.return_value = mock_response({"sqlite": [], "postgres": []})
+
+        with patch("quantrocket.db.time.monotonic", return_value=100):
+            list_databases()
+        with patch("quantrocket.db.time.monotonic", return_value=100 + db._LIST_DB_CACHE_TTL - 1):
+            list_databases()
+        self.assertEqual(mock_houston.get.call_count, 1)
+
+        with patch("quantrocket.db.time.monotonic", return_value=100 + db._LIST_DB_CACHE_TTL):
+            list_databases()
+        self.assertEqual(mock_houston.get.call_count, 2)
+
+    @patch("quantrocket.db.houston")
+    def test_mutating_calls_clear_cache(self, mock_houston):
+        mock_houston.get.return_value = mock_response({"sqlite": [], "postgres": []})
+        mock_houston.put.return_value = mock_response({"status": "ok"})
+        mock_houston.post.return_value = mock_response({"status": "ok"})
+
+        for func in (s3_push_databases, s3_pull_databases, optimize_databases):
+            list_databases()
+            self.assertTrue(db._LIST_DB_CACHE)
+            func(services="history")
+            self.assertFalse(db._LIST_DB_CACHE)
+
+    @patch("quantrocket.db.houston")
+    def test_history_and_realtime_drop_db_clear_cache(self, mock_db_houston):
+        mock_db_houston.get.return_value = mock_response({"sqlite": [], "postgres": []})
+
+        for module in (history, realtime):
+            list_databases()
+            self.assertTrue(db._LIST_DB_CACHE)
+            with patch.object(module, "houston") as mock_houston:
+                mock_houston.delete.return_value = mock_response({"status": "deleted"})
+                module.drop_db("usa-stk-1d", confirm_by_typing_db_code_again="usa-stk-1d")
+            self.assertFalse(db._LIST_DB_CACHE)
+
+        self.assertEqual(mock_db_houston.get.call_count, 2)
+
+    @patch("quantrocket.db.houston")
+    def test_realtime_create_tick_db_clears_cache(self, mock_db_houston):
+        mock_db_houston.get.return_value = mock_response({"sqlite": [], "postgres": []})
+
+        list_databases()
+        self.assertTrue(db._LIST_DB_CACHE)
+        with patch.object(realtime, "houston") as mock_houston:
+            mock_houston.put.return_value = mock_response({"status": "successfully created"})
+            realtime.create_ibkr_tick_db("usa-stk-trades", universes="usa-stk")
+        self.assertFalse(db._LIST_DB_CACHE)
+
+    @patch("quantrocket.db.houston")
+    def test_clear_during_request_not_cached(self, mock_houston):
+
+        def get(path, params):
+            if path == "/db/s3":
+                return mock_response({"status": "ok"})
+            # simulate a pull completing while the listing is in progress
+            s3_pull_databases(services="history")
+            return mock_response({"sqlite": ["stale"], "postgres": []})
+
+        mock_houston.get.side_effect = get
+
+        self.assertDictEqual(list_databases(), {"sqlite": ["stale"], "postgres": []})
+        self.assertFalse(db._LIST_DB_CACHE)
+        self.assertFalse(db._LIST_DB_INFLIGHT)
+
+        mock_houston.get.side_effect = None
+        mock_houston.get.return_value = mock_response({"sqlite": ["fresh"], "postgres": []})
+        self.assertDictEqual(list_databases(), {"sqlite": ["fresh"], "postgres": []})
+
+    @patch.dict(os.environ, {"QUANTROCKET_DISABLE_DB_CACHE": "1"})
+    @patch("quantrocket.db.houston")
+    def test_disable_cache(self, mock_houston):
+        mock_houston.get.return_value = mock_response({"sqlite": [], "postgres": []})
+
+        list_databases()
+        list_databases()
+        self.assertEqual(mock_houston.get.call_count, 2)
+        self.assertFalse(db._LIST_DB_CACHE)
+
+    @patch("quantrocket.db._LIST_DB_CACHE_TTL", 0)
+    @patch("quantrocket.db.houston")
+    def test_concurrent_calls_share_request(self, mock_houston):
+        release = threading.Event()
+
+        def get(path, params):
+            release.wait(5)
+            return mock_response({"sqlite": ["a"], "postgres": []})
+
+        mock_houston.get.side_effect = get
+
+        # count the callers waiting on the in-flight request
+        waiting = threading.Condition()
+        num_waiting = 0
+
+        class CountingFuture(Future):
+
+            def result(self, timeout=None):
+                nonlocal num_waiting
+                with waiting:
+                    num_waiting += 1
+                    waiting.notify_all()
+                return super().result(timeout)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(list_databases()))
+            for _ in range(3)]
+        with patch("quantrocket.db.Future", CountingFuture):
+            for thread in threads:
+                thread.start()
+            # release the request once the other two callers are waiting on it
+            with waiting:
+                self.assertTrue(waiting.wait_for(lambda: num_waiting == 2, timeout=5))
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(mock_houston.get.call_count, 1)
+        self.assertListEqual(results, [{"sqlite": ["a"], "postgres": []}] * 3)
+        self.assertFalse(db._LIST_DB_INFLIGHT)
+
+    @patch("quantrocket.db.houston")
+    def test_cache_rechecked_under_lock(self, mock_houston):
+        lock = db._LIST_DB_LOCK
+        key = db._list_databases_cache_key(None, None, False, False)
+
+        class RacingLock:
+            """
+            Simulates another request storing its result just before the
+            lock is acquired.
+            """
+            def __enter__(self):
+                lock.acquire()
+                db._LIST_DB_CACHE[key] = (time.monotonic(), {"sqlite": ["a"], "postgres": []})
+
+            def __exit__(self, *exc_info):
+                lock.release()
+
+        with patch("quantrocket.db._LIST_DB_LOCK", RacingLock()):
+            databases = list_databases()
+
+        self.assertDictEqual(databases, {"sqlite": ["a"], "postgres": []})
+        mock_houston.get.assert_not_called()
+        self.assertFalse(db._LIST_DB_INFLIGHT)
+
+    @patch("quantrocket.db.houston")
+    def test_failed_request_not_cached(self, mock_houston):
+        mock_houston.get.side_effect = ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            list_databases()
+
+        self.assertFalse(db._LIST_DB_CACHE)
+        self.assertFalse(db._LIST_DB_INFLIGHT)
+
+class S3ParallelTestCase(unittest.TestCase):
+
+    def setUp(self):
+        db._LIST_DB_CACHE.clear()
+        self.addCleanup(db._LIST_DB_CACHE.clear)
+
+    @patch("quantrocket.db.houston")
+    def test_push_single_code(self, mock_houston):
+        mock_houston.put.return_value = mock_response({"status": "ok"})
+
+        s3_push_databases(services="history", codes=["nyse"])
+        mock_houston.put.assert_called_once_with(
+            "/db/s3", params={"services": "history", "codes": ["nyse"]})
+
+    @patch("quantrocket.db.houston")
+    def test_push_multiple_codes_in_parallel_chunks(self, mock_houston):
+        mock_houston.put.side_effect = lambda path, params: mock_response(
+            {"status": "ok", "codes": params["codes"], "count": len(params["codes"])})
+
+        with patch.dict(os.environ, {"QUANTROCKET_DB_PARALLEL": "2"}):
+            response = s3_push_databases(services="history", codes=["a", "b", "c"])
+
+        self.assertEqual(mock_houston.put.call_count, 2)
+        requested_codes = sorted(
+            code for call in mock_houston.put.call_args_list
+            for code in call.kwargs["params"]["codes"])
+        self.assertListEqual(requested_codes, ["a", "b", "c"])
+        for call in mock_houston.put.call_args_list:
+            self.assertEqual(call.kwargs["params"]["services"], "history")
+
+        self.assertEqual(response["status"], "ok")
+        self.assertEqual(response["count"], 3)
+        self.assertListEqual(sorted(response["codes"]), ["a", "b", "c"])
+
+    @patch.dict(os.environ, {"QUANTROCKET_DB_PARALLEL": "2"})
+    @patch("quantrocket.db.houston")
+    def test_push_one_chunk_fails(self, mock_houston):
+        def put(path, params):
+            if "b" in params["codes"]:
+                error = requests.HTTPError("500 Server Error")
+                error.json_response = {"status": "error", "msg": "push failed"}
+                raise error
+            return mock_response({"status": "ok"})
+
+        mock_houston.put.side_effect = put
+        db._LIST_DB_CACHE[("dummy",)] = (time.monotonic(), {})
+
+        with self.assertRaises(requests.HTTPError) as cm:
+            s3_push_databases(codes=["a", "b", "c"])
+
+        # both chunks were requested
+        self.assertEqual(mock_houston.put.call_count, 2)
+        # chunks are ["a", "c"] and ["b"]
+        self.assertDictEqual(
+            cm.exception.json_response,
+            {
+                "status": "error",
+                "msg": "push failed",
+                "failed_codes": ["b"],
+                "triggered_codes": ["a", "c"],
+            })
+        self.assertIn(
+            "request failed for codes: b (request succeeded for codes: a, c)",
+            cm.exception.args)
+        # the cache is cleared even though the push failed
+        self.assertFalse(db._LIST_DB_CACHE)
+
+    @patch.dict(os.environ, {"QUANTROCKET_DB_PARALLEL": "2"})
+    @patch("quantrocket.db.houston")
+    def test_pull_one_chunk_fails_without_json_response(self, mock_houston):
+        def get(path, params):
+            if "b" in params["codes"]:
+                error = requests.HTTPError("502 Bad Gateway")
+                # set by raise_for_status_with_json if the body isn't JSON
+                error.json_response = {}
+                raise error
+            return mock_response({"status": "ok"})
+
+        mock_houston.get.side_effect = get
+
+        with self.assertRaises(requests.HTTPError) as cm:
+            s3_pull_databases(codes=["a", "b", "c"])
+
+        self.assertDictEqual(
+            cm.exception.json_response,
+            {
+                "status": "error",
+                "msg": "HTTPError('502 Bad Gateway')",
+                "failed_codes": ["b"],
+                "triggered_codes": ["a", "c"],
+            })
+
+    @patch.dict(os.environ, {"QUANTROCKET_DB_PARALLEL": "0"})
+    @patch("quantrocket.db.houston")
+    def test_pull_parallel_disabled(self, mock_houston):
+        mock_houston.get.return_value = mock_response({"status": "ok"})
+
+        s3_pull_databases(codes=["a", "b", "c"], force=True)
+        mock_houston.get.assert_called_once_with(
+            "/db/s3", params={"codes": ["a", "b", "c"], "force": True})
+
+class GetS3ConfigTestCase(unittest.TestCase):
+
+    @patch("quantrocket.db.houston")
+    def test_empty_response(self, mock_houston):
+        response = mock_response(None)
+        response.status_code = 204
+        response.headers = {}
+        mock_houston.get.return_value = response
+
+        self.assertDictEqual(get_s3_config(), {})
+
+        response.status_code = 200
+        response.headers = {"Content-Length": "0"}
+        self.assertDictEqual(get_s3_config(), {})
+
+        # empty body without a Content-Length header
+        response.headers = {"Transfer-Encoding": "chunked"}
+        response.content = b""
+        self.assertDictEqual(get_s3_config(), {})
+
+    @patch("quantrocket.db.houston")
+    def test_config(self, mock_houston):
+        response = mock_response({"bucket": "my-bucket"})
+        response.status_code = 200
+        response.headers = {"Content-Length": "23"}
+        mock_houston.get.return_value = response
+
+        self.assertDictEqual(get_s3_config(), {"bucket": "my-bucket"})
+
+class JsonDecodingTestCase(unittest.TestCase):
+
+    @patch("quantrocket.db.orjson", None)
+    def test_decode_without_orjson(self):
+        response = MagicMock()
+        response.content = b'{"sqlite": ["a"]}'
+        response.json.side_effect = lambda: json.loads(response.content)
+
+        self.assertDictEqual(db._json(response), {"sqlite": ["a"]})
+        response.json.assert_called_once_with()
+
+    @patch("quantrocket.db.orjson")
+    def test_decode_with_orjson(self, mock_orjson):
+        mock_orjson.JSONDecodeError = json.JSONDecodeError
+        mock_orjson.loads.side_effect = json.loads
+        response = MagicMock()
+        response.content = b'{"sqlite": ["a"]}'
+
+        self.assertDictEqual(db._json(response), {"sqlite": ["a"]})
+        mock_orjson.loads.assert_called_once_with(b'{"sqlite": ["a"]}')
+        response.json.assert_not_called()
+
+    @patch("quantrocket.db.orjson")
+    def test_fall_back_if_orjson_cannot_decode(self, mock_orjson):
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        mock_orjson.JSONDecodeError = json.JSONDecodeError
+        mock_orjson.loads.side_effect = json.JSONDecodeError("unexpected character", "", 0)
+        response = MagicMock()
+        response.content = b'{"a": NaN}'
+        response.json.side_effect = lambda: json.loads(response.content)
+
+        decoded = db._json(response)
+        self.assertListEqual(list(decoded), ["a"])
+        self.assertNotEqual(decoded["a"], decoded["a"])  # NaN
+        mock_orjson.loads.assert_called_once_with(b'{"a": NaN}')
+        response.json.assert_called_once_with()
+
+    def test_fall_back_with_real_orjson(self):
+        if db.orjson is None:
+            self.skipTest("orjson is not installed")
+        response = MagicMock()
+        response.content = b'{"a": NaN}'
+        response.json.side_effect = lambda: json.loads(response.content)
+
+        decoded = db._json(response)
+        self.assertListEqual(list(decoded), ["a"])
+        response.json.assert_called_once_with()
@@ -0,0 +1,53 @@
+# Copyright 2017-2024 QuantRocket LLC - All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# To run: pytest path/to/quantrocket/tests -v
+
+import unittest
+from unittest.mock import patch
+import requests
+from quantrocket.houston import Houston
+
+class HoustonRequestTestCase(unittest.TestCase):
+
+    @patch.object(requests.Session, "request")
+    def test_move_long_tuple_params_to_data(self, mock_request):
+        sids = tuple("FIBBG{0}".format(i) for i in range(51))
+
+        Houston().get("http://houston/realtime/usa-stk.csv", params={"sids": sids, "fields": ("LastPrice",)})
+
+        kwargs = mock_request.call_args.kwargs
+        self.assertDictEqual(kwargs["params"], {"fields": ("LastPrice",)})
+        self.assertDictEqual(kwargs["data"], {"sids": sids})
+
+    @patch.object(requests.Session, "request")
+    def test_keep_short_tuple_params(self, mock_request):
+        sids = tuple("FIBBG{0}".format(i) for i in range(50))
+
+        Houston().get("http://houston/realtime/usa-stk.csv", params={"sids": sids})
+
+        kwargs = mock_request.call_args.kwargs
+        self.assertDictEqual(kwargs["params"], {"sids": sids})
+        self.assertNotIn("data", kwargs)
+
+class HoustonConnectionPoolTestCase(unittest.TestCase):
+
+    def test_pool_sizes(self):
+        houston = Houston()
+        for prefix in ("http://", "https://"):
+            adapter = houston.get_adapter(prefix + "houston/ping")
+            self.assertEqual(adapter._pool_connections, Houston.POOL_CONNECTIONS)
+            self.assertEqual(adapter._pool_maxsize, Houston.POOL_MAXSIZE)
+            self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 16)
+            self.assertEqual(adapter.poolmanager.pools._maxsize, 4)
@@ -54,11 +54,20 @@ Usage Guide:
 * Database Management: https://qrok.it/dl/qr/db
 * Custom Data: https://qrok.it/dl/qr/custom-data
 """
+import os
+import copy
+import time
 import getpass
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 from typing import TYPE_CHECKING, Union
 if TYPE_CHECKING:
     import pandas as pd
     import sqlalchemy
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from quantrocket.houston import houston
 from quantrocket.exceptions import DataInsertionError
 from quantrocket._cli.utils.output import json_to_cli
@@ -76,6 +85,155 @@ __all__ = [
     "insert_or_ignore",
 ]
 
+# list_databases responses are cached in-process for this many seconds, keyed
+# by the request parameters. Set QUANTROCKET_DISABLE_DB_CACHE to disable.
+_LIST_DB_CACHE_TTL = 5.0
+_LIST_DB_CACHE: dict[tuple, tuple[float, dict]] = {}
+# Cache misses which are already being requested, so that concurrent callers
+# with the same parameters wait for one request rather than each making one
+_LIST_DB_INFLIGHT: dict[tuple, Future] = {}
+# Incremented each time the cache is cleared, so that a request which was
+# already in progress when the cache was cleared doesn't cache its (possibly
+# stale) result
+_LIST_DB_CACHE_GENERATION = 0
+# Guards the in-flight requests and the cache generation
+_LIST_DB_LOCK = threading.Lock()
+
+def _clear_list_databases_cache():
+    """
+    Clears cached list_databases responses, after an operation which may
+    have changed the databases. Called by the db functions as well as the
+    history and realtime functions which create or drop databases.
+    """
+    global _LIST_DB_CACHE_GENERATION
+    with _LIST_DB_LOCK:
+        _LIST_DB_CACHE_GENERATION += 1
+        _LIST_DB_CACHE.clear()
+        # requests already in progress may return stale results, so don't
+        # let new callers wait on them
+        _LIST_DB_INFLIGHT.clear()
+
+def _json(response):
+    """
+    Decodes a JSON response, using orjson if installed (which is
+    considerably faster for large responses such as detailed database
+    listings), else the standard library. orjson is stricter than the
+    standard library (for example it rejects NaN), so fall back to the
+    standard library for anything orjson can't decode.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
+
+def _params(**kwargs):
+    """
+    Returns a dict of request params or data, omitting empty values.
+    """
+    return {k: v for k, v in kwargs.items() if v}
+
+def _list_databases_cache_key(services, codes, detail, expand):
+    if isinstance(services, str):
+        services = [services]
+    if isinstance(codes, str):
+        codes = [codes]
+    return (tuple(services or ()), tuple(codes or ()), bool(detail), bool(expand))
+
+def _is_list_databases_cache_enabled():
+    return not os.environ.get("QUANTROCKET_DISABLE_DB_CACHE")
+
+def _get_s3_parallelism():
+    """
+    Returns the number of parallel requests to split a multi-code S3 push or
+    pull into, from QUANTROCKET_DB_PARALLEL (default 4; 0 or 1 disables).
+    """
+    try:
+        return int(os.environ.get("QUANTROCKET_DB_PARALLEL", 4))
+    except ValueError:
+        return 4
+
+def _merge_json_responses(responses):
+    """
+    Merges JSON dicts returned by chunked requests: lists are concatenated,
+    numbers are summed, and for other values the first is kept.
+    """
+    merged = {}
+    for response in responses:
+        for k, v in response.items():
+            if k not in merged:
+                merged[k] = v
+            elif isinstance(v, list):
+                merged[k] = merged[k] + v
+            elif isinstance(v, (int, float)) and not isinstance(v, bool):
+                merged[k] += v
+    return merged
+
+def _request_s3(method, params):
+    """
+    Makes a request to /db/s3. If multiple codes are given, splits them into
+    chunks which are requested in parallel and merges the responses.
+
+    If any chunk fails, the other chunks are still allowed to complete, and
+    the first error is re-raised with the codes that failed and the codes
+    that were successfully triggered attached (in the message and, for HTTP
+    errors, in the json_response).
+    """
+    request = getattr(houston, method)
+
+    def _request(params):
+        response = request("/db/s3", params=params)
+        houston.raise_for_status_with_json(response)
+        return _json(response)
+
+    codes = params.get("codes")
+    parallelism = _get_s3_parallelism()
+    if not isinstance(codes, (list, tuple)) or len(codes) <= 1 or parallelism <= 1:
+        return _request(params)
+
+    num_chunks = min(parallelism, len(codes))
+    chunked_params = [
+        dict(params, codes=list(codes[i::num_chunks])) for i in range(num_chunks)]
+    responses = []
+    triggered_codes = []
+    failed_codes = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=num_chunks) as executor:
+        futures = {
+            executor.submit(_request, chunk_params): chunk_params["codes"]
+            for chunk_params in chunked_params}
+        for future in as_completed(futures):
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                failed_codes.extend(futures[future])
+                errors.append(e)
+            else:
+                triggered_codes.extend(futures[future])
+
+    if errors:
+        # report codes in the order they were given
+        triggered_codes = [code for code in codes if code in triggered_codes]
+        failed_codes = [code for code in codes if code in failed_codes]
+        error = errors[0]
+        if isinstance(getattr(error, "json_response", None), dict):
+            # the json response may be empty if the error body couldn't be
+            # parsed, so make sure it still reports the error
+            json_response = {"status": "error", "msg": repr(error)}
+            json_response.update(error.json_response)
+            json_response.update(
+                failed_codes=failed_codes,
+                triggered_codes=triggered_codes)
+            error.json_response = json_response
+        error.args = error.args + (
+            "request failed for codes: {0} (request succeeded for codes: {1})".format(
+                ", ".join(failed_codes) or "none",
+                ", ".join(triggered_codes) or "none"),)
+        raise error
+
+    return _merge_json_responses(responses)
+
 def list_databases(
     services: Union[list[str], str] = None,
     codes: Union[list[str], str] = None,
@@ -85,6 +243,12 @@ def list_databases(
     """
     List databases.
 
+    Results are cached in-process for a few seconds, so repeated or
+    concurrent calls with the same parameters do not each make a request to
+    the db service. The cache is cleared by functions in this client which
+    create, drop, push, pull, or optimize databases, and can be disabled by
+    setting the environment variable QUANTROCKET_DISABLE_DB_CACHE.
+
     Parameters
     ----------
     services : list of str, optional
@@ -122,19 +286,67 @@ def list_databases(
     >>> databases = list_databases(detail=True)
     >>> databases = pd.DataFrame.from_records(itertools.chain(databases["sqlite"], databases["postgres"]))
     """
-    params = {}
-    if services:
-        params["services"] = services
-    if codes:
-        params["codes"] = codes
-    if detail:
-        params["detail"] = detail
-    if expand:
-        params["expand"] = expand
+    params = _params(services=services, codes=codes, detail=detail, expand=expand)
+
+    if not _is_list_databases_cache_enabled():
+        return _request_databases(params)
 
+    key = _list_databases_cache_key(services, codes, detail, expand)
+    cached = _get_cached_databases(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    with _LIST_DB_LOCK:
+        # check the cache again, in case another request stored its result
+        # (and removed its in-flight entry) since the check above
+        cached = _get_cached_databases(key)
+        inflight = _LIST_DB_INFLIGHT.get(key)
+        if cached is None and inflight is None:
+            future = _LIST_DB_INFLIGHT[key] = Future()
+            generation = _LIST_DB_CACHE_GENERATION
+
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    # another caller is already requesting these databases, wait for it
+    if inflight is not None:
+        return copy.deepcopy(inflight.result())
+
+    try:
+        databases = _request_databases(params)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        cached_databases = copy.deepcopy(databases)
+        with _LIST_DB_LOCK:
+            # don't cache the result if the cache was cleared in the meantime
+            if generation == _LIST_DB_CACHE_GENERATION:
+                _LIST_DB_CACHE[key] = (time.monotonic(), cached_databases)
+        future.set_result(cached_databases)
+    finally:
+        with _LIST_DB_LOCK:
+            # the entry may since have been cleared and replaced by a newer
+            # request, in which case leave it
+            if _LIST_DB_INFLIGHT.get(key) is future:
+                del _LIST_DB_INFLIGHT[key]
+
+    return databases
+
+def _get_cached_databases(key):
+    """
+    Returns the cached list_databases response for the key, or None if not
+    cached or expired.
+    """
+    cached = _LIST_DB_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < _LIST_DB_CACHE_TTL:
+        return cached[1]
+    return None
+
+def _request_databases(params):
     response = houston.get("/db/databases", params=params)
     houston.raise_for_status_with_json(response)
-    return response.json()
+    return _json(response)
 
 def _cli_list_databases(*args, **kwargs):
     return json_to_cli(list_databases, *args, **kwargs)
@@ -156,10 +368,14 @@ def get_s3_config() -> dict[str, str]:
     """
     response = houston.get("/db/s3config")
     houston.raise_for_status_with_json(response)
-    # It's possible to get a 204 empty response
+    # It's possible to get a 204 empty response; check the status and headers
+    # first, then fall back to checking the body (e.g. for chunked or
+    # compressed responses without a Content-Length)
+    if response.status_code == 204 or response.headers.get("Content-Length") == "0":
+        return {}
     if not response.content:
         return {}
-    return response.json()
+    return _json(response)
 
 def set_s3_config(
     access_key_id: str = None,
@@ -203,19 +419,15 @@ def set_s3_config(
     if access_key_id and not secret_access_key:
         secret_access_key = getpass.getpass(prompt="Enter AWS Secret Access Key: ")
 
-    data = {}
-    if access_key_id:
-        data["access_key_id"] = access_key_id
-    if secret_access_key:
-        data["secret_access_key"] = secret_access_key
-    if bucket:
-        data["bucket"] = bucket
-    if region:
-        data["region"] = region
+    data = _params(
+        access_key_id=access_key_id,
+        secret_access_key=secret_access_key,
+        bucket=bucket,
+        region=region)
 
     response = houston.put("/db/s3config", data=data)
     houston.raise_for_status_with_json(response)
-    return response.json()
+    return _json(response)
 
 def _cli_get_or_set_s3_config(access_key_id=None, secret_access_key=None,
                                    bucket=None, region=None, *args, **kwargs):
@@ -231,6 +443,12 @@ def s3_push_databases(
     """
     Push database(s) to Amazon S3.
 
+    If multiple codes are given, they are split across parallel requests
+    (4 by default, configurable with the environment variable
+    QUANTROCKET_DB_PARALLEL; set to 0 to make a single request). If any of
+    the requests fail, the error lists which codes failed and which were
+    successfully requested.
+
     Parameters
     ----------
     serivces : list of str, optional
@@ -250,14 +468,12 @@ def s3_push_databases(
 
     * Amazon S3: http://qrok.it/dl/qr/dbs3
     """
-    params = {}
-    if services:
-        params["services"] = services
-    if codes:
-        params["codes"] = codes
-    response = houston.put("/db/s3", params=params)
-    houston.raise_for_status_with_json(response)
-    return response.json()
+    params = _params(services=services, codes=codes)
+    try:
+        return _request_s3("put", params)
+    finally:
+        # some databases may have been pushed even if the request failed
+        _clear_list_databases_cache()
 
 def _cli_s3_push_databases(*args, **kwargs):
     return json_to_cli(s3_push_databases, *args, **kwargs)
@@ -270,6 +486,12 @@ def s3_pull_databases(
     """
     Pull database(s) from Amazon S3.
 
+    If multiple codes are given, they are split across parallel requests
+    (4 by default, configurable with the environment variable
+    QUANTROCKET_DB_PARALLEL; set to 0 to make a single request). If any of
+    the requests fail, the error lists which codes failed and which were
+    successfully requested.
+
     Parameters
     ----------
     serivces : list of str, optional
@@ -293,16 +515,12 @@ def s3_pull_databases(
 
     * Amazon S3: http://qrok.it/dl/qr/dbs3
     """
-    params = {}
-    if services:
-        params["services"] = services
-    if codes:
-        params["codes"] = codes
-    if force:
-        params["force"] = force
-    response = houston.get("/db/s3", params=params)
-    houston.raise_for_status_with_json(response)
-    return response.json()
+    params = _params(services=services, codes=codes, force=force)
+    try:
+        return _request_s3("get", params)
+    finally:
+        # some databases may have been pulled even if the request failed
+        _clear_list_databases_cache()
 
 def _cli_s3_pull_databases(*args, **kwargs):
     return json_to_cli(s3_pull_databases, *args, **kwargs)
@@ -336,14 +554,11 @@ def optimize_databases(
 
     * Database Management: https://qrok.it/dl/qr/db
     """
-    params = {}
-    if codes:
-        params["codes"] = codes
-    if services:
-        params["services"] = services
+    params = _params(services=services, codes=codes)
     response = houston.post("/db/optimizations", params=params)
     houston.raise_for_status_with_json(response)
-    return response.json()
+    _clear_list_databases_cache()
+    return _json(response)
 
 def _cli_optimize_databases(*args, **kwargs):
     return json_to_cli(optimize_databases, *args, **kwargs)
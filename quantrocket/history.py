@@ -70,6 +70,7 @@ import requests
 from typing import Union, Literal
 from quantrocket.utils._typing import FilepathOrBuffer
 from quantrocket.houston import houston
+from quantrocket.db import _clear_list_databases_cache
 from quantrocket._cli.utils.output import json_to_cli
 from quantrocket._cli.utils.files import write_response_to_filepath_or_buffer
 from quantrocket._cli.utils.parse import dict_strs_to_dict, dict_to_dict_strs
@@ -127,6 +128,7 @@ def create_edi_db(
     response = houston.put("/history/databases/{0}".format(code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_edi_db(*args, **kwargs):
@@ -279,6 +281,7 @@ def create_ibkr_db(
     response = houston.put("/history/databases/{0}".format(code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_ibkr_db(*args, **kwargs):
@@ -323,6 +326,7 @@ def create_sharadar_db(
     response = houston.put("/history/databases/{0}".format(code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_sharadar_db(*args, **kwargs):
@@ -393,6 +397,7 @@ def create_usstock_db(
     response = houston.put("/history/databases/{0}".format(code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_usstock_db(*args, **kwargs):
@@ -476,6 +481,7 @@ def create_custom_db(
     response = houston.put("/history/databases/{0}".format(code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_custom_db(*args, **kwargs):
@@ -544,6 +550,7 @@ def drop_db(
     params = {"confirm_by_typing_db_code_again": confirm_by_typing_db_code_again}
     response = houston.delete("/history/databases/{0}".format(code), params=params)
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_drop_db(*args, **kwargs):
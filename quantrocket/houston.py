@@ -28,6 +28,7 @@ ping
 import os
 import six
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import uuid
 from .exceptions import ImproperlyConfigured, CannotConnectToHouston
@@ -99,8 +100,19 @@ class Houston(requests.Session):
 
     DEFAULT_TIMEOUT = 120
 
+    # Number of per-host connection pools to cache
+    POOL_CONNECTIONS = 4
+    # Number of keep-alive connections to retain in each pool, which bounds
+    # how many concurrent requests (e.g. from multiple threads) can reuse a
+    # connection rather than opening a new one
+    POOL_MAXSIZE = 16
+
     def __init__(self):
         super(Houston, self).__init__()
+        for prefix in ("http://", "https://"):
+            self.mount(prefix, HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE))
         if "HOUSTON_USERNAME" in os.environ and "HOUSTON_PASSWORD" in os.environ:
             self.auth = (os.environ["HOUSTON_USERNAME"], os.environ["HOUSTON_PASSWORD"])
         self.force_timeout = _get_force_timeout()
@@ -173,7 +185,7 @@ To set the environment variable on Linux, run:
 
         # Move params to data if too long
         for param_name, param_vals in kwargs.get("params", {}).copy().items():
-            if isinstance(param_vals, list) and len(param_vals) > 50:
+            if isinstance(param_vals, (list, tuple)) and len(param_vals) > 50:
                 data = kwargs.get("data", {}) or {}
                 data[param_name] = param_vals
                 kwargs["params"].pop(param_name)
@@ -69,6 +69,7 @@ from typing import Union, Literal
 from quantrocket.utils._typing import FilepathOrBuffer
 from quantrocket._cli.utils.files import write_response_to_filepath_or_buffer
 from quantrocket.houston import houston
+from quantrocket.db import _clear_list_databases_cache
 from quantrocket.exceptions import NoRealtimeData, ParameterError
 from quantrocket._cli.utils.output import json_to_cli
 from quantrocket._cli.utils.parse import dict_strs_to_dict, dict_to_dict_strs
@@ -158,6 +159,7 @@ def create_ibkr_tick_db(
     response = houston.put("/realtime/databases/{0}".format(code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_ibkr_tick_db(*args, **kwargs):
@@ -221,6 +223,7 @@ def create_polygon_tick_db(
     response = houston.put("/realtime/databases/{0}".format(code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_polygon_tick_db(*args, **kwargs):
@@ -284,6 +287,7 @@ def create_alpaca_tick_db(
     response = houston.put("/realtime/databases/{0}".format(code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_alpaca_tick_db(*args, **kwargs):
@@ -371,6 +375,7 @@ def create_agg_db(
     response = houston.put("/realtime/databases/{0}/aggregates/{1}".format(tick_db_code, code), params=params)
 
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_create_agg_db(*args, **kwargs):
@@ -453,6 +458,7 @@ def drop_db(
         params["cascade"] = cascade
     response = houston.delete("/realtime/databases/{0}".format(code), params=params)
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_drop_db(*args, **kwargs):
@@ -510,6 +516,7 @@ def drop_ticks(
     params = {"older_than": older_than}
     response = houston.delete("/realtime/ticks/{0}".format(code), params=params)
     houston.raise_for_status_with_json(response)
+    _clear_list_databases_cache()
     return response.json()
 
 def _cli_drop_ticks(*args, **kwargs):
@@ -32,6 +32,10 @@ setup(name='quantrocket-client',
         "python-dateutil",
         "pyyaml",
     ],
+    extras_require={
+        # faster JSON decoding of large responses
+        "orjson": ["orjson"],
+    },
     entry_points = {
         'console_scripts': ['quantrocket=quantrocket._cli.commands:main'],
     },